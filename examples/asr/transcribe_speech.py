@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import contextlib
+import functools
 import os
 from dataclasses import dataclass, is_dataclass
 from typing import Optional
@@ -27,7 +28,10 @@ from nemo.collections.asr.models.ctc_models import EncDecCTCModel
 from nemo.collections.asr.parts.utils.transcribe_utils import (
     compute_output_filename,
     prepare_audio_data,
+    read_manifest_durations,
+    restore_transcription_order,
     setup_model,
+    sort_filepaths_by_duration,
     transcribe_partial_audio,
     write_transcription,
 )
@@ -49,13 +53,19 @@ Transcribe audio file on a single CPU/GPU. Useful for transcription of moderate
 
   output_filename: Output filename where the transcriptions will be written
   batch_size: batch size during inference
+  num_workers: number of DataLoader workers for audio loading. Defaults to half of the available CPUs (2 to 8)
+  sort_by_duration: Bool to batch files of similar duration together to reduce padding. Output order is preserved
 
   cuda: Optional int to enable or disable execution of model on certain CUDA device.
   amp: Bool to decide if Automatic Mixed Precision should be used during inference
+  amp_dtype: Str dtype used for AMP. Supported = bfloat16, float16. Falls back to float16 if bfloat16 is not supported
   audio_type: Str filetype of the audio. Supported = wav, flac, mp3
+  compile_encoder: Bool to compile the encoder with torch.compile (PyTorch 2.0+) for CPU inference
 
   overwrite_transcripts: Bool which when set allowes repeated transcriptions to overwrite previous results.
 
+  ctc_batched: Bool to decode the whole batch of CTC log probabilities at once (also with return_hypotheses=True)
+
   rnnt_decoding: Decoding sub-config for RNNT. Refer to documentation for specific values.
 
 # Usage
@@ -80,6 +90,15 @@ python transcribe_speech.py \
 """
 
 
+def get_default_num_workers() -> int:
+    """ Half of the CPUs this process may run on (respecting CPU affinity), at least 2 and at most 8 """
+    if hasattr(os, 'sched_getaffinity'):
+        num_cpus = len(os.sched_getaffinity(0))
+    else:
+        num_cpus = os.cpu_count() or 1
+    return min(8, max(2, num_cpus // 2))
+
+
 @dataclass
 class TranscriptionConfig:
     # Required configs
@@ -91,7 +110,9 @@ class TranscriptionConfig:
     # General configs
     output_filename: Optional[str] = None
     batch_size: int = 32
-    num_workers: int = 0
+    sort_by_duration: bool = True  # Batch files of similar duration together, results keep the input order
+    # Load and decode audio in background workers to keep the accelerator busy. 0 loads in the main process only
+    num_workers: int = get_default_num_workers()
     append_pred: bool = False  # Sets mode of work, if True it will add new field transcriptions.
     pred_name_postfix: Optional[str] = None  # If you need to use another model name, rather than standard one.
 
@@ -103,13 +124,18 @@ class TranscriptionConfig:
     # If `cuda` is a negative number, inference will be on CPU only.
     cuda: Optional[int] = None
     amp: bool = False
+    amp_dtype: str = "bfloat16"  # bfloat16 avoids fp16 overflows; falls back to float16 if the GPU lacks support
     audio_type: str = "wav"
+    # Compile the encoder with torch.compile for CPU inference, requires PyTorch 2.0+
+    compile_encoder: bool = False
 
     # Recompute model transcription, even if the output folder exists with scores.
     overwrite_transcripts: bool = True
 
     # Decoding strategy for CTC models
     ctc_decoding: CTCDecodingConfig = CTCDecodingConfig()
+    # Run greedy CTC decoding for the whole batch at once instead of looping over samples
+    ctc_batched: bool = True
 
     # Decoding strategy for RNNT models
     rnnt_decoding: RNNTDecodingConfig = RNNTDecodingConfig(fused_batch_size=-1)
@@ -117,7 +143,9 @@ class TranscriptionConfig:
 
 @hydra_runner(config_name="TranscriptionConfig", schema=TranscriptionConfig)
 def main(cfg: TranscriptionConfig) -> TranscriptionConfig:
-    logging.info(f'Hydra config: {OmegaConf.to_yaml(cfg)}')
+    # serializing the config to YAML is only worth it when INFO messages are emitted
+    if logging.get_verbosity() <= logging.INFO:
+        logging.info(f'Hydra config: {OmegaConf.to_yaml(cfg)}')
 
     if is_dataclass(cfg):
         cfg = OmegaConf.structured(cfg)
@@ -147,6 +175,14 @@ def main(cfg: TranscriptionConfig) -> TranscriptionConfig:
     asr_model.set_trainer(trainer)
     asr_model = asr_model.eval()
 
+    # compile encoder for CPU inference (optional)
+    if cfg.compile_encoder and accelerator == 'cpu':
+        if hasattr(torch, 'compile'):
+            logging.info("Compiling the encoder with torch.compile")
+            asr_model.encoder = torch.compile(asr_model.encoder, dynamic=True)
+        else:
+            logging.warning(f"torch.compile is not available in PyTorch {torch.__version__}, encoder is not compiled.")
+
     # collect additional transcription information
     return_hypotheses = True
 
@@ -161,15 +197,22 @@ def main(cfg: TranscriptionConfig) -> TranscriptionConfig:
             cfg.rnnt_decoding.compute_langs = cfg.compute_langs
             asr_model.change_decoding_strategy(cfg.rnnt_decoding)
         else:
+            cfg.ctc_decoding.greedy.batched_inference = cfg.ctc_batched
             asr_model.change_decoding_strategy(cfg.ctc_decoding)
 
     # prepare audio filepaths and decide wether it's partical audio
     filepaths, partial_audio = prepare_audio_data(cfg)
 
     # setup AMP (optional)
-    if cfg.amp and torch.cuda.is_available() and hasattr(torch.cuda, 'amp') and hasattr(torch.cuda.amp, 'autocast'):
-        logging.info("AMP enabled!\n")
-        autocast = torch.cuda.amp.autocast
+    if cfg.amp and cfg.amp_dtype not in ("bfloat16", "float16"):
+        raise ValueError(f"Unsupported amp_dtype `{cfg.amp_dtype}`. Supported = bfloat16, float16")
+    if cfg.amp and torch.cuda.is_available() and hasattr(torch, 'amp') and hasattr(torch.amp, 'autocast'):
+        amp_dtype = getattr(torch, cfg.amp_dtype)
+        if amp_dtype == torch.bfloat16 and not torch.cuda.is_bf16_supported():
+            logging.warning("bfloat16 is not supported on this device, falling back to float16 for AMP.")
+            amp_dtype = torch.float16
+        logging.info(f"AMP enabled with dtype {amp_dtype}!\n")
+        autocast = functools.partial(torch.amp.autocast, device_type="cuda", dtype=amp_dtype)
     else:
 
         @contextlib.contextmanager
@@ -187,9 +230,20 @@ def main(cfg: TranscriptionConfig) -> TranscriptionConfig:
         )
         return cfg
 
+    # sort audio files by duration to reduce padding within each batch
+    sorted_ids = None
+    if cfg.sort_by_duration and not partial_audio:
+        manifest_durations = None
+        if cfg.audio_dir is None or cfg.append_pred:
+            # files are listed in the manifest, its `duration` fields save reading the audio files
+            manifest_durations = read_manifest_durations(cfg.dataset_manifest)
+        transcribe_filepaths, sorted_ids = sort_filepaths_by_duration(filepaths, manifest_durations)
+    else:
+        transcribe_filepaths = filepaths
+
     # transcribe audio
     with autocast():
-        with torch.no_grad():
+        with torch.inference_mode():
             if partial_audio:
                 if isinstance(asr_model, EncDecCTCModel):
                     transcriptions = transcribe_partial_audio(
@@ -204,14 +258,14 @@ def main(cfg: TranscriptionConfig) -> TranscriptionConfig:
                         "RNNT models do not support transcribe partial audio for now. Transcribing full audio."
                     )
                     transcriptions = asr_model.transcribe(
-                        paths2audio_files=filepaths,
+                        paths2audio_files=transcribe_filepaths,
                         batch_size=cfg.batch_size,
                         num_workers=cfg.num_workers,
                         return_hypotheses=return_hypotheses,
                     )
             else:
                 transcriptions = asr_model.transcribe(
-                    paths2audio_files=filepaths,
+                    paths2audio_files=transcribe_filepaths,
                     batch_size=cfg.batch_size,
                     num_workers=cfg.num_workers,
                     return_hypotheses=return_hypotheses,
@@ -221,8 +275,11 @@ def main(cfg: TranscriptionConfig) -> TranscriptionConfig:
     logging.info(f"Writing transcriptions into file: {cfg.output_filename}")
 
     # if transcriptions form a tuple (from RNNT), extract just "best" hypothesis
-    if type(transcriptions) == tuple and len(transcriptions) == 2:
-        transcriptions = transcriptions[0]
+    if isinstance(transcriptions, tuple) and len(transcriptions) == 2:
+        transcriptions, _ = transcriptions
+
+    if sorted_ids is not None:
+        transcriptions = restore_transcription_order(transcriptions, sorted_ids)
 
     # write audio transcriptions
     output_filename = write_transcription(transcriptions, cfg, model_name, filepaths, compute_langs)
@@ -157,6 +157,8 @@ class AbstractCTCDecoding(ConfidenceMixin):
                 preserve_alignments: Same as above, overrides above value.
                 compute_timestamps: Same as above, overrides above value.
                 preserve_frame_confidence: Same as above, overrides above value.
+                batched_inference: Bool flag to run the argmax for the whole batch at once on the device
+                    of the log probabilities, instead of copying them to the CPU and decoding each sample.
 
         blank_id: The id of the RNNT blank token.
     """
@@ -214,6 +216,7 @@ class AbstractCTCDecoding(ConfidenceMixin):
                 compute_timestamps=self.compute_timestamps,
                 preserve_frame_confidence=self.preserve_frame_confidence,
                 confidence_method_cfg=self.confidence_method_cfg,
+                batched_inference=self.cfg.greedy.get('batched_inference', False),
             )
 
         else:
@@ -835,6 +838,8 @@ class CTCDecoding(AbstractCTCDecoding):
                 compute_timestamps: Same as above, overrides above value.
                 preserve_frame_confidence: Same as above, overrides above value.
                 confidence_method: Same as above, overrides confidence_cfg.method.
+                batched_inference: Bool flag to run the argmax for the whole batch at once on the device
+                    of the log probabilities, instead of copying them to the CPU and decoding each sample.
 
         blank_id: The id of the RNNT blank token.
     """
@@ -112,6 +112,8 @@ class CTCBPEDecoding(AbstractCTCDecoding):
                 compute_timestamps: Same as above, overrides above value.
                 preserve_frame_confidence: Same as above, overrides above value.
                 confidence_method: Same as above, overrides confidence_cfg.method.
+                batched_inference: Bool flag to run the argmax for the whole batch at once on the device
+                    of the log probabilities, instead of copying them to the CPU and decoding each sample.
 
         tokenizer: NeMo tokenizer object, which inherits from TokenizerSpec.
     """
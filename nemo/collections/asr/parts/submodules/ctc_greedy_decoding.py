@@ -70,6 +70,9 @@ class GreedyCTCInfer(Typing, ConfidenceMeasureMixin):
         preserve_frame_confidence: Bool flag which preserves the history of per-frame confidence scores
             generated during decoding. When set to true, the Hypothesis will contain
             the non-null value for `frame_confidence` in it. Here, `frame_confidence` is a List of floats.
+        batched_inference: Bool flag which computes the argmax over the whole batch of log probabilities at once,
+            on the device they were produced on, and only moves the resulting labels to the CPU. Otherwise,
+            the full log probabilities are moved to the CPU and every sample is decoded independently.
         confidence_method_cfg: A dict-like object which contains the method name and settings to compute per-frame
             confidence scores.
 
@@ -129,11 +132,13 @@ class GreedyCTCInfer(Typing, ConfidenceMeasureMixin):
         compute_timestamps: bool = False,
         preserve_frame_confidence: bool = False,
         confidence_method_cfg: Optional[DictConfig] = None,
+        batched_inference: bool = False,
     ):
         super().__init__()
 
         self.blank_id = blank_id
         self.preserve_alignments = preserve_alignments
+        self.batched_inference = batched_inference
         # we need timestamps to extract non-blank per-frame confidence
         self.compute_timestamps = compute_timestamps | preserve_frame_confidence
         self.preserve_frame_confidence = preserve_frame_confidence
@@ -157,16 +162,21 @@ class GreedyCTCInfer(Typing, ConfidenceMeasureMixin):
             packed list containing batch number of sentences (Hypotheses).
         """
         with torch.inference_mode():
-            hypotheses = []
-            # Process each sequence independently
-            prediction_cpu_tensor = decoder_output.cpu()
-
-            if prediction_cpu_tensor.ndim < 2 or prediction_cpu_tensor.ndim > 3:
+            if decoder_output.ndim < 2 or decoder_output.ndim > 3:
                 raise ValueError(
                     f"`decoder_output` must be a tensor of shape [B, T] (labels, int) or "
-                    f"[B, T, V] (log probs, float). Provided shape = {prediction_cpu_tensor.shape}"
+                    f"[B, T, V] (log probs, float). Provided shape = {decoder_output.shape}"
                 )
 
+            if self.batched_inference and decoder_output.ndim == 3:
+                hypotheses = self._greedy_decode_logprobs_batched(decoder_output, decoder_lengths)
+                packed_result = pack_hypotheses(hypotheses, decoder_lengths)
+                return (packed_result,)
+
+            hypotheses = []
+            # Process each sequence independently
+            prediction_cpu_tensor = decoder_output.cpu()
+
             # determine type of input - logprobs or labels
             if prediction_cpu_tensor.ndim == 2:  # labels
                 greedy_decode = self._greedy_decode_labels
@@ -213,6 +223,58 @@ class GreedyCTCInfer(Typing, ConfidenceMeasureMixin):
 
         return hypothesis
 
+    @torch.no_grad()
+    def _greedy_decode_logprobs_batched(self, x: torch.Tensor, out_len: torch.Tensor):
+        # x: [B, T, D]
+        # out_len: [B]
+        batch_size, max_time = x.shape[0], x.shape[1]
+
+        # Argmax and score reduction run once for the whole batch on the device of the log probs
+        prediction_logprobs, prediction_labels = x.max(dim=-1)
+        non_blank_ids = prediction_labels != self.blank_id
+
+        if out_len is not None:
+            # lengths may also be given as a list of int
+            out_len = torch.as_tensor(out_len, device=x.device)
+            time_ids = torch.arange(max_time, device=x.device)
+            non_blank_ids &= time_ids[None, :] < out_len[:, None]
+            out_len_cpu = out_len.to('cpu')
+        else:
+            out_len_cpu = None
+
+        scores = torch.where(non_blank_ids, prediction_logprobs, torch.zeros_like(prediction_logprobs)).sum(dim=-1)
+
+        # Only labels and scores are moved to CPU, full log probs are copied just when they are requested
+        prediction_labels = prediction_labels.cpu()
+        non_blank_ids = non_blank_ids.cpu()
+        scores = scores.cpu()
+        if self.preserve_alignments or self.preserve_frame_confidence:
+            prediction_cpu_tensor = x.detach().cpu()
+
+        hypotheses = []
+        for ind in range(batch_size):
+            length = out_len_cpu[ind] if out_len_cpu is not None else max_time
+
+            # Initialize blank state and empty label set in Hypothesis
+            hypothesis = rnnt_utils.Hypothesis(score=0.0, y_sequence=[], dec_state=None, timestep=[], last_token=None)
+            labels = prediction_labels[ind, :length]
+            hypothesis.y_sequence = labels.numpy().tolist()
+            hypothesis.score = scores[ind]
+
+            if self.preserve_alignments:
+                # Preserve the logprobs, as well as labels after argmax
+                hypothesis.alignments = (prediction_cpu_tensor[ind, :length].clone(), labels.clone())
+
+            if self.compute_timestamps:
+                hypothesis.timestep = torch.nonzero(non_blank_ids[ind, :length], as_tuple=False)[:, 0].numpy().tolist()
+
+            if self.preserve_frame_confidence:
+                hypothesis.frame_confidence = self._get_confidence(prediction_cpu_tensor[ind, :length])
+
+            hypotheses.append(hypothesis)
+
+        return hypotheses
+
     @torch.no_grad()
     def _greedy_decode_labels(self, x: torch.Tensor, out_len: torch.Tensor):
         # x: [T]
@@ -251,4 +313,5 @@ class GreedyCTCInferConfig:
     preserve_alignments: bool = False
     compute_timestamps: bool = False
     preserve_frame_confidence: bool = False
+    batched_inference: bool = False
     confidence_method_cfg: Optional[ConfidenceMethodConfig] = None
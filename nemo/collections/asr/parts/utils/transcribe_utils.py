@@ -14,9 +14,11 @@
 import glob
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 
+import soundfile as sf
 import torch
 from omegaconf import DictConfig
 from tqdm.auto import tqdm
@@ -230,6 +232,53 @@ def prepare_audio_data(cfg: DictConfig) -> Tuple[List[str], bool]:
     return filepaths, partial_audio
 
 
+def read_manifest_durations(manifest_filepath: str) -> List[Optional[float]]:
+    """
+    Read the `duration` of every file listed in a manifest, see `sort_filepaths_by_duration`.
+    Entries without a `duration` or with an `offset` (the duration is then the one of a segment) are None.
+    """
+    durations = []
+    with open(manifest_filepath, 'r') as f:
+        for line in f:
+            item = json.loads(line)
+            durations.append(item['duration'] if 'duration' in item and 'offset' not in item else None)
+    return durations
+
+
+def sort_filepaths_by_duration(
+    filepaths: List[str], durations: Optional[List[Optional[float]]] = None
+) -> Tuple[List[str], List[int]]:
+    """
+    Sort audio files by duration, so that each batch contains files of similar length and less padding is computed.
+    Durations which are not given (e.g. from the manifest) are read from the audio files.
+    Returns the sorted filepaths and their indices in the original list, see `restore_transcription_order`.
+    """
+    if durations is None:
+        durations = [None] * len(filepaths)
+    missing_ids = [idx for idx, duration in enumerate(durations) if duration is None]
+    if missing_ids:
+        try:
+            with ThreadPoolExecutor() as executor:
+                missing_durations = list(executor.map(lambda idx: sf.info(filepaths[idx]).duration, missing_ids))
+        except RuntimeError as e:
+            logging.warning(f"Could not read audio durations, files will be transcribed in the original order: {e}")
+            return filepaths, list(range(len(filepaths)))
+        durations = list(durations)
+        for idx, duration in zip(missing_ids, missing_durations):
+            durations[idx] = duration
+
+    sorted_ids = sorted(range(len(filepaths)), key=lambda idx: durations[idx])
+    return [filepaths[idx] for idx in sorted_ids], sorted_ids
+
+
+def restore_transcription_order(transcriptions: List, sorted_ids: List[int]) -> List:
+    """ Put transcriptions of files sorted by `sort_filepaths_by_duration` back to the original order of files """
+    ordered_transcriptions = [None] * len(sorted_ids)
+    for idx, transcription in zip(sorted_ids, transcriptions):
+        ordered_transcriptions[idx] = transcription
+    return ordered_transcriptions
+
+
 def compute_output_filename(cfg: DictConfig, model_name: str) -> DictConfig:
     """ Compute filename of output manifest and update cfg"""
     if cfg.output_filename is None:
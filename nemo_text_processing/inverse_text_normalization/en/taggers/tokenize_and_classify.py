@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import os
+from functools import lru_cache
 
 import pynini
 from nemo_text_processing.inverse_text_normalization.en.taggers.cardinal import CardinalFst
@@ -33,6 +34,9 @@ from nemo_text_processing.text_normalization.en.graph_utils import (
     delete_extra_space,
     delete_space,
     generator_main,
+    insert_space,
+    insert_tokens_close,
+    insert_tokens_open,
 )
 from pynini.lib import pynutil
 
@@ -48,64 +52,83 @@ class ClassifyFst(GraphFst):
     Args:
         cache_dir: path to a dir with .far grammar file. Set to None to avoid using cache.
         overwrite_cache: set to True to overwrite .far files
+
+    The grammars are compiled once per process for every `cache_dir` and `overwrite_cache` combination,
+    further instances reuse them.
     """
 
     def __init__(self, cache_dir: str = None, overwrite_cache: bool = False):
         super().__init__(name="tokenize_and_classify", kind="classify")
+        self.fst = _get_classify_fst(cache_dir=cache_dir, overwrite_cache=overwrite_cache)
+
 
-        far_file = None
-        if cache_dir is not None and cache_dir != "None":
-            os.makedirs(cache_dir, exist_ok=True)
-            far_file = os.path.join(cache_dir, "_en_itn.far")
-        if not overwrite_cache and far_file and os.path.exists(far_file):
-            self.fst = pynini.Far(far_file, mode="r")["tokenize_and_classify"]
-            logging.info(f"ClassifyFst.fst was restored from {far_file}.")
-        else:
-            logging.info(f"Creating ClassifyFst grammars.")
-            cardinal = CardinalFst()
-            cardinal_graph = cardinal.fst
-
-            ordinal = OrdinalFst(cardinal)
-            ordinal_graph = ordinal.fst
-
-            decimal = DecimalFst(cardinal)
-            decimal_graph = decimal.fst
-
-            measure_graph = MeasureFst(cardinal=cardinal, decimal=decimal).fst
-            date_graph = DateFst(ordinal=ordinal).fst
-            word_graph = WordFst().fst
-            time_graph = TimeFst().fst
-            money_graph = MoneyFst(cardinal=cardinal, decimal=decimal).fst
-            whitelist_graph = WhiteListFst().fst
-            punct_graph = PunctuationFst().fst
-            electronic_graph = ElectronicFst().fst
-            telephone_graph = TelephoneFst(cardinal).fst
-
-            classify = (
-                pynutil.add_weight(whitelist_graph, 1.01)
-                | pynutil.add_weight(time_graph, 1.1)
-                | pynutil.add_weight(date_graph, 1.09)
-                | pynutil.add_weight(decimal_graph, 1.1)
-                | pynutil.add_weight(measure_graph, 1.1)
-                | pynutil.add_weight(cardinal_graph, 1.1)
-                | pynutil.add_weight(ordinal_graph, 1.1)
-                | pynutil.add_weight(money_graph, 1.1)
-                | pynutil.add_weight(telephone_graph, 1.1)
-                | pynutil.add_weight(electronic_graph, 1.1)
-                | pynutil.add_weight(word_graph, 100)
-            )
-
-            punct = pynutil.insert("tokens { ") + pynutil.add_weight(punct_graph, weight=1.1) + pynutil.insert(" }")
-            token = pynutil.insert("tokens { ") + classify + pynutil.insert(" }")
-            token_plus_punct = (
-                pynini.closure(punct + pynutil.insert(" ")) + token + pynini.closure(pynutil.insert(" ") + punct)
-            )
-
-            graph = token_plus_punct + pynini.closure(delete_extra_space + token_plus_punct)
-            graph = delete_space + graph + delete_space
-
-            self.fst = graph.optimize()
-
-            if far_file:
-                generator_main(far_file, {"tokenize_and_classify": self.fst})
-                logging.info(f"ClassifyFst grammars are saved to {far_file}.")
+@lru_cache(maxsize=None)
+def _get_classify_fst(cache_dir: str = None, overwrite_cache: bool = False) -> 'pynini.FstLike':
+    """
+    Compiles (or restores from cache_dir) the grammar of ClassifyFst, see ClassifyFst for the arguments.
+    Results are memoized as the grammar only depends on the arguments.
+    """
+    far_file = None
+    if cache_dir is not None and cache_dir != "None":
+        os.makedirs(cache_dir, exist_ok=True)
+        far_file = os.path.join(cache_dir, "_en_itn.far")
+    if not overwrite_cache and far_file and os.path.exists(far_file):
+        fst = pynini.Far(far_file, mode="r")["tokenize_and_classify"]
+        logging.info(f"ClassifyFst.fst was restored from {far_file}.")
+    else:
+        logging.info(f"Creating ClassifyFst grammars.")
+        cardinal = CardinalFst()
+        cardinal_graph = cardinal.fst
+
+        ordinal = OrdinalFst(cardinal)
+        ordinal_graph = ordinal.fst
+
+        decimal = DecimalFst(cardinal)
+        decimal_graph = decimal.fst
+
+        measure_graph = MeasureFst(cardinal=cardinal, decimal=decimal).fst
+        date_graph = DateFst(ordinal=ordinal).fst
+        word_graph = WordFst().fst
+        time_graph = TimeFst().fst
+        money_graph = MoneyFst(cardinal=cardinal, decimal=decimal).fst
+        whitelist_graph = WhiteListFst().fst
+        punct_graph = PunctuationFst().fst
+        electronic_graph = ElectronicFst().fst
+        telephone_graph = TelephoneFst(cardinal).fst
+
+        class_graphs = [
+            (whitelist_graph, 1.01),
+            (time_graph, 1.1),
+            (date_graph, 1.09),
+            (decimal_graph, 1.1),
+            (measure_graph, 1.1),
+            (cardinal_graph, 1.1),
+            (ordinal_graph, 1.1),
+            (money_graph, 1.1),
+            (telephone_graph, 1.1),
+            (electronic_graph, 1.1),
+            (word_graph, 100),
+        ]
+        # union the class grammars in ascending order of weight, classes with equal weights keep their order.
+        # The grammars are arc-sorted on input labels before they are combined
+        class_graphs = sorted(class_graphs, key=lambda x: x[1])
+        classify = pynini.union(
+            *[pynutil.add_weight(graph.arcsort(sort_type="ilabel"), weight) for graph, weight in class_graphs]
+        )
+
+        punct = insert_tokens_open + pynutil.add_weight(punct_graph, weight=1.1) + insert_tokens_close
+        token = insert_tokens_open + classify + insert_tokens_close
+        token_plus_punct = pynini.closure(punct + insert_space) + token + pynini.closure(insert_space + punct)
+
+        # concatenate in place to avoid copying the intermediate graphs before the optimization
+        graph = delete_space + token_plus_punct
+        graph.concat(pynini.closure(delete_extra_space + token_plus_punct))
+        graph.concat(delete_space)
+
+        fst = graph.optimize()
+
+        if far_file:
+            generator_main(far_file, {"tokenize_and_classify": fst})
+            logging.info(f"ClassifyFst grammars are saved to {far_file}.")
+
+    return fst
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import os
+from functools import lru_cache
 
 import pynini
 from nemo_text_processing.inverse_text_normalization.en.taggers.punctuation import PunctuationFst
@@ -32,6 +33,9 @@ from nemo_text_processing.text_normalization.en.graph_utils import (
     delete_extra_space,
     delete_space,
     generator_main,
+    insert_space,
+    insert_tokens_close,
+    insert_tokens_open,
 )
 from nemo_text_processing.text_normalization.ru.taggers.tokenize_and_classify import ClassifyFst as TNClassifyFst
 from pynini.lib import pynutil
@@ -48,67 +52,86 @@ class ClassifyFst(GraphFst):
     Args:
         cache_dir: path to a dir with .far grammar file. Set to None to avoid using cache.
         overwrite_cache: set to True to overwrite .far files
+
+    The grammars are compiled once per process for every `cache_dir` and `overwrite_cache` combination,
+    further instances reuse them.
     """
 
     def __init__(self, cache_dir: str = None, overwrite_cache: bool = False):
         super().__init__(name="tokenize_and_classify", kind="classify")
+        self.fst = _get_classify_fst(cache_dir=cache_dir, overwrite_cache=overwrite_cache)
+
 
-        far_file = None
-        if cache_dir is not None and cache_dir != "None":
-            os.makedirs(cache_dir, exist_ok=True)
-            far_file = os.path.join(cache_dir, "_ru_itn.far")
-        if not overwrite_cache and far_file and os.path.exists(far_file):
-            self.fst = pynini.Far(far_file, mode="r")["tokenize_and_classify"]
-            logging.info(f"ClassifyFst.fst was restored from {far_file}.")
-        else:
-            logging.info(f"Creating ClassifyFst grammars. This might take some time...")
-            tn_classify = TNClassifyFst(
-                input_case='cased', deterministic=False, cache_dir=cache_dir, overwrite_cache=True
-            )
-            cardinal = CardinalFst(tn_cardinal=tn_classify.cardinal)
-            cardinal_graph = cardinal.fst
-
-            ordinal = OrdinalFst(tn_ordinal=tn_classify.ordinal)
-            ordinal_graph = ordinal.fst
-
-            decimal = DecimalFst(tn_decimal=tn_classify.decimal)
-            decimal_graph = decimal.fst
-
-            measure_graph = MeasureFst(tn_measure=tn_classify.measure).fst
-            date_graph = DateFst(tn_date=tn_classify.date).fst
-            word_graph = WordFst().fst
-            time_graph = TimeFst(tn_time=tn_classify.time).fst
-            money_graph = MoneyFst(tn_money=tn_classify.money).fst
-            whitelist_graph = WhiteListFst().fst
-            punct_graph = PunctuationFst().fst
-            electronic_graph = ElectronicFst(tn_electronic=tn_classify.electronic).fst
-            telephone_graph = TelephoneFst(tn_telephone=tn_classify.telephone).fst
-
-            classify = (
-                pynutil.add_weight(whitelist_graph, 1.01)
-                | pynutil.add_weight(time_graph, 1.1)
-                | pynutil.add_weight(date_graph, 1.09)
-                | pynutil.add_weight(decimal_graph, 1.1)
-                | pynutil.add_weight(measure_graph, 1.1)
-                | pynutil.add_weight(ordinal_graph, 1.1)
-                | pynutil.add_weight(money_graph, 1.1)
-                | pynutil.add_weight(telephone_graph, 1.1)
-                | pynutil.add_weight(electronic_graph, 1.1)
-                | pynutil.add_weight(cardinal_graph, 1.1)
-                | pynutil.add_weight(word_graph, 100)
-            )
-
-            punct = pynutil.insert("tokens { ") + pynutil.add_weight(punct_graph, weight=1.1) + pynutil.insert(" }")
-            token = pynutil.insert("tokens { ") + classify + pynutil.insert(" }")
-            token_plus_punct = (
-                pynini.closure(punct + pynutil.insert(" ")) + token + pynini.closure(pynutil.insert(" ") + punct)
-            )
-
-            graph = token_plus_punct + pynini.closure(pynutil.add_weight(delete_extra_space, 1.1) + token_plus_punct)
-
-            graph = delete_space + graph + delete_space
-            self.fst = graph.optimize()
-
-            if far_file:
-                generator_main(far_file, {"tokenize_and_classify": self.fst})
-                logging.info(f"ClassifyFst grammars are saved to {far_file}.")
+@lru_cache(maxsize=None)
+def _get_classify_fst(cache_dir: str = None, overwrite_cache: bool = False) -> 'pynini.FstLike':
+    """
+    Compiles (or restores from cache_dir) the grammar of ClassifyFst, see ClassifyFst for the arguments.
+    Results are memoized as the grammar only depends on the arguments.
+    """
+    far_file = None
+    if cache_dir is not None and cache_dir != "None":
+        os.makedirs(cache_dir, exist_ok=True)
+        far_file = os.path.join(cache_dir, "_ru_itn.far")
+    if not overwrite_cache and far_file and os.path.exists(far_file):
+        fst = pynini.Far(far_file, mode="r")["tokenize_and_classify"]
+        logging.info(f"ClassifyFst.fst was restored from {far_file}.")
+    else:
+        logging.info(f"Creating ClassifyFst grammars. This might take some time...")
+        # TN grammars have to be re-created, the per-class taggers are not available when restored from .far.
+        # Only the per-class taggers are used, so the composed TN grammar is not exported to cache_dir
+        tn_classify = TNClassifyFst(input_case='cased', deterministic=False, cache_dir=None, overwrite_cache=True)
+        cardinal = CardinalFst(tn_cardinal=tn_classify.cardinal)
+        cardinal_graph = cardinal.fst
+
+        ordinal = OrdinalFst(tn_ordinal=tn_classify.ordinal)
+        ordinal_graph = ordinal.fst
+
+        decimal = DecimalFst(tn_decimal=tn_classify.decimal)
+        decimal_graph = decimal.fst
+
+        measure_graph = MeasureFst(tn_measure=tn_classify.measure).fst
+        date_graph = DateFst(tn_date=tn_classify.date).fst
+        word_graph = WordFst().fst
+        time_graph = TimeFst(tn_time=tn_classify.time).fst
+        money_graph = MoneyFst(tn_money=tn_classify.money).fst
+        whitelist_graph = WhiteListFst().fst
+        punct_graph = PunctuationFst().fst
+        electronic_graph = ElectronicFst(tn_electronic=tn_classify.electronic).fst
+        telephone_graph = TelephoneFst(tn_telephone=tn_classify.telephone).fst
+
+        class_graphs = [
+            (whitelist_graph, 1.01),
+            (time_graph, 1.1),
+            (date_graph, 1.09),
+            (decimal_graph, 1.1),
+            (measure_graph, 1.1),
+            (ordinal_graph, 1.1),
+            (money_graph, 1.1),
+            (telephone_graph, 1.1),
+            (electronic_graph, 1.1),
+            (cardinal_graph, 1.1),
+            (word_graph, 100),
+        ]
+        # union the class grammars in ascending order of weight, classes with equal weights keep their order.
+        # The grammars are arc-sorted on input labels before they are combined
+        class_graphs = sorted(class_graphs, key=lambda x: x[1])
+        classify = pynini.union(
+            *[pynutil.add_weight(graph.arcsort(sort_type="ilabel"), weight) for graph, weight in class_graphs]
+        )
+
+        punct = insert_tokens_open + pynutil.add_weight(punct_graph, weight=1.1) + insert_tokens_close
+        token = insert_tokens_open + classify + insert_tokens_close
+        token_plus_punct = pynini.closure(punct + insert_space) + token + pynini.closure(insert_space + punct)
+
+        # concatenate in place to avoid copying the intermediate graphs before the optimization,
+        # the weight of delete_extra_space is applied per additional token on purpose
+        graph = delete_space + token_plus_punct
+        graph.concat(pynini.closure(pynutil.add_weight(delete_extra_space, 1.1) + token_plus_punct))
+        graph.concat(delete_space)
+        fst = graph.optimize()
+
+        if far_file:
+            generator_main(far_file, {"tokenize_and_classify": fst})
+            logging.info(f"ClassifyFst grammars are saved to {far_file}.")
+
+    return fst
@@ -26,8 +26,10 @@ from nemo.collections.asr.metrics.rnnt_wer import RNNTWER
 from nemo.collections.asr.metrics.rnnt_wer_bpe import RNNTBPEWER
 from nemo.collections.asr.metrics.wer import WER, CTCDecoding, CTCDecodingConfig, word_error_rate
 from nemo.collections.asr.metrics.wer_bpe import WERBPE, CTCBPEDecoding, CTCBPEDecodingConfig
+from nemo.collections.asr.parts.submodules.ctc_greedy_decoding import GreedyCTCInferConfig
 from nemo.collections.asr.parts.utils.rnnt_utils import Hypothesis
 from nemo.collections.common.tokenizers import CharTokenizer
+from nemo.core.classes import typecheck
 from nemo.utils.config_utils import assert_dataclass_signature_match
 
 
@@ -352,6 +354,44 @@ class TestWordErrorRate:
         assert len(hyp.timestep) == 3
         assert hyp.alignments is not None
 
+    @pytest.mark.unit
+    def test_char_decoding_logprobs_batched(self):
+        B, T, V = 4, 8, len(self.vocabulary)
+        torch.manual_seed(0)
+        decoder_outputs = torch.randn(B, T, V, dtype=torch.float32)
+        decoder_lens = torch.randint(1, T, size=[B], dtype=torch.int32)
+        decoder_lens[torch.randint(0, B, [1])[0]] = T
+
+        decoding_cfg = CTCDecodingConfig(preserve_alignments=True, compute_timestamps=True)
+        decoding = CTCDecoding(decoding_cfg, vocabulary=self.vocabulary)
+
+        decoding_cfg = CTCDecodingConfig(
+            preserve_alignments=True, compute_timestamps=True, greedy=GreedyCTCInferConfig(batched_inference=True),
+        )
+        batched_decoding = CTCDecoding(decoding_cfg, vocabulary=self.vocabulary)
+
+        def assert_batched_hyps_match(lens):
+            hyps, _ = decoding.ctc_decoder_predictions_tensor(decoder_outputs, lens, return_hypotheses=True)
+            batched_hyps, _ = batched_decoding.ctc_decoder_predictions_tensor(
+                decoder_outputs, lens, return_hypotheses=True
+            )
+
+            assert len(batched_hyps) == len(hyps)
+            for hyp, batched_hyp in zip(hyps, batched_hyps):
+                assert batched_hyp.text == hyp.text
+                assert batched_hyp.length == hyp.length
+                assert batched_hyp.timestep == hyp.timestep
+                assert torch.equal(batched_hyp.y_sequence, hyp.y_sequence)
+                assert torch.allclose(batched_hyp.score, hyp.score)
+                assert torch.equal(batched_hyp.alignments[0], hyp.alignments[0])
+                assert torch.equal(batched_hyp.alignments[1], hyp.alignments[1])
+
+        assert_batched_hyps_match(decoder_lens)
+
+        # lengths given as a list of int, which the decoders accept when type checks are disabled
+        with typecheck.disable_checks():
+            assert_batched_hyps_match(decoder_lens.tolist())
+
     @pytest.mark.unit
     def test_subword_decoding_logprobs(self):
         B, T, V = 1, 8, self.char_tokenizer.vocab_size
@@ -0,0 +1,89 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from nemo.collections.asr.parts.utils.transcribe_utils import (
+    read_manifest_durations,
+    restore_transcription_order,
+    sort_filepaths_by_duration,
+)
+
+
+def write_audio_files(directory, durations, sample_rate=16000):
+    filepaths = []
+    for idx, duration in enumerate(durations):
+        filepath = os.path.join(directory, f'{idx}.wav')
+        sf.write(filepath, np.zeros(int(duration * sample_rate), dtype=np.float32), sample_rate)
+        filepaths.append(filepath)
+    return filepaths
+
+
+class TestTranscribeUtils:
+    @pytest.mark.unit
+    def test_sort_filepaths_by_duration(self, tmpdir):
+        filepaths = write_audio_files(str(tmpdir), [0.3, 0.1, 0.4, 0.2])
+
+        sorted_filepaths, sorted_ids = sort_filepaths_by_duration(filepaths)
+        assert sorted_filepaths == [filepaths[1], filepaths[3], filepaths[0], filepaths[2]]
+        assert sorted_ids == [1, 3, 0, 2]
+
+        # transcriptions of the sorted files are written in the original order
+        assert restore_transcription_order(sorted_filepaths, sorted_ids) == filepaths
+
+    @pytest.mark.unit
+    def test_sort_filepaths_by_given_durations(self, tmpdir):
+        filepaths = write_audio_files(str(tmpdir), [0.1, 0.2, 0.3])
+        # given durations are used instead of the ones of the files, the missing one is read from the file
+        sorted_filepaths, sorted_ids = sort_filepaths_by_duration(filepaths, [1.0, None, 0.5])
+        assert sorted_filepaths == [filepaths[1], filepaths[2], filepaths[0]]
+        assert restore_transcription_order(sorted_filepaths, sorted_ids) == filepaths
+
+        # files are not opened when all durations are given
+        missing_filepaths = [os.path.join(str(tmpdir), f'missing_{idx}.wav') for idx in range(3)]
+        sorted_filepaths, sorted_ids = sort_filepaths_by_duration(missing_filepaths, [2.0, 3.0, 1.0])
+        assert sorted_ids == [2, 0, 1]
+
+    @pytest.mark.unit
+    def test_sort_filepaths_by_duration_unreadable_file(self, tmpdir):
+        filepaths = write_audio_files(str(tmpdir), [0.2, 0.1])
+        not_audio = os.path.join(str(tmpdir), 'not_audio.wav')
+        with open(not_audio, 'w') as f:
+            f.write('not audio')
+        filepaths.append(not_audio)
+
+        # files keep the original order if a duration can not be read
+        sorted_filepaths, sorted_ids = sort_filepaths_by_duration(filepaths)
+        assert sorted_filepaths == filepaths
+        assert sorted_ids == [0, 1, 2]
+        assert restore_transcription_order(sorted_filepaths, sorted_ids) == filepaths
+
+    @pytest.mark.unit
+    def test_read_manifest_durations(self, tmpdir):
+        manifest = os.path.join(str(tmpdir), 'manifest.json')
+        items = [
+            {'audio_filepath': 'a.wav', 'duration': 1.5},
+            {'audio_filepath': 'b.wav'},
+            {'audio_filepath': 'c.wav', 'offset': 0.5, 'duration': 1.0},
+        ]
+        with open(manifest, 'w') as f:
+            for item in items:
+                f.write(json.dumps(item) + '\n')
+
+        assert read_manifest_durations(manifest) == [1.5, None, None]
@@ -0,0 +1,29 @@
+# Copyright (c) 2022, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from . import utils
+
+
+@pytest.fixture(scope="session")
+def fr_inverse_normalizer():
+    """ French InverseNormalizer, the grammars are only built when a test requests it """
+    return utils.get_inverse_normalizer(lang='fr', cache_dir=utils.CACHE_DIR)
+
+
+@pytest.fixture(scope="session")
+def ru_inverse_normalizer():
+    """ Russian InverseNormalizer, the grammars are only built when a test requests it """
+    return utils.get_inverse_normalizer(lang='ru', cache_dir=utils.CACHE_DIR)
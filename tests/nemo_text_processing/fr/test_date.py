@@ -13,30 +13,24 @@
 # limitations under the License.
 
 import pytest
-from parameterized import parameterized
 
-from ..utils import CACHE_DIR, parse_test_case_file
+from ..utils import parse_test_case_file
 
-try:
-    from nemo_text_processing.inverse_text_normalization.inverse_normalize import InverseNormalizer
-
-    PYNINI_AVAILABLE = True
-except (ImportError, ModuleNotFoundError):
-    PYNINI_AVAILABLE = False
+# skips the whole module at collection, the test cases are not even parametrized without pynini
+pytest.importorskip(
+    "nemo_text_processing.inverse_text_normalization.inverse_normalize",
+    reason="`pynini` not installed, please install via nemo_text_processing/pynini_install.sh",
+)
 
 
+# with `pytest -n auto --dist loadgroup` the tests of a group run on one worker, so its grammars are built only once
+@pytest.mark.xdist_group(name="fr_itn")
 class TestDate:
-    inverse_normalizer = (
-        InverseNormalizer(lang='fr', cache_dir=CACHE_DIR, overwrite_cache=False) if PYNINI_AVAILABLE else None
-    )
-
-    @parameterized.expand(parse_test_case_file('fr/data_inverse_text_normalization/test_cases_date.txt'))
-    @pytest.mark.skipif(
-        not PYNINI_AVAILABLE,
-        reason="`pynini` not installed, please install via nemo_text_processing/pynini_install.sh",
+    @pytest.mark.parametrize(
+        "test_input,expected", parse_test_case_file('fr/data_inverse_text_normalization/test_cases_date.txt')
     )
     @pytest.mark.run_only_on('CPU')
     @pytest.mark.unit
-    def test_denorm(self, test_input, expected):
-        pred = self.inverse_normalizer.inverse_normalize(test_input, verbose=False)
+    def test_denorm(self, fr_inverse_normalizer, test_input, expected):
+        pred = fr_inverse_normalizer.inverse_normalize(test_input, verbose=False)
         assert pred == expected
@@ -13,135 +13,114 @@
 # limitations under the License.
 
 import pytest
-from parameterized import parameterized
 
-from ..utils import CACHE_DIR, parse_test_case_file
+from ..utils import parse_test_case_file
 
-try:
-    from nemo_text_processing.inverse_text_normalization.inverse_normalize import InverseNormalizer
-
-    PYNINI_AVAILABLE = True
-except (ImportError, ModuleNotFoundError):
-    PYNINI_AVAILABLE = False
+# skips the whole module at collection, the test cases are not even parametrized without pynini
+pytest.importorskip(
+    "nemo_text_processing.inverse_text_normalization.inverse_normalize",
+    reason="`pynini` not installed, please install via nemo_text_processing/pynini_install.sh",
+)
 
 
+# with `pytest -n auto --dist loadgroup` the tests of a group run on one worker, so its grammars are built only once
+@pytest.mark.xdist_group(name="ru_itn")
 class TestRuInverseNormalize:
-
-    normalizer = InverseNormalizer(lang='ru', cache_dir=CACHE_DIR) if PYNINI_AVAILABLE else None
-
-    @parameterized.expand(parse_test_case_file('ru/data_inverse_text_normalization/test_cases_cardinal.txt'))
-    @pytest.mark.skipif(
-        not PYNINI_AVAILABLE,
-        reason="`pynini` not installed, please install via nemo_text_processing/pynini_install.sh",
+    @pytest.mark.parametrize(
+        "test_input,expected", parse_test_case_file('ru/data_inverse_text_normalization/test_cases_cardinal.txt')
     )
     @pytest.mark.run_only_on('CPU')
     @pytest.mark.unit
-    def test_denorm_cardinal(self, test_input, expected):
-        pred = self.normalizer.inverse_normalize(test_input, verbose=False)
+    def test_denorm_cardinal(self, ru_inverse_normalizer, test_input, expected):
+        pred = ru_inverse_normalizer.inverse_normalize(test_input, verbose=False)
         assert expected == pred
 
-    @parameterized.expand(parse_test_case_file('ru/data_inverse_text_normalization/test_cases_ordinal.txt'))
-    @pytest.mark.skipif(
-        not PYNINI_AVAILABLE,
-        reason="`pynini` not installed, please install via nemo_text_processing/pynini_install.sh",
+    @pytest.mark.parametrize(
+        "test_input,expected", parse_test_case_file('ru/data_inverse_text_normalization/test_cases_ordinal.txt')
     )
     @pytest.mark.run_only_on('CPU')
     @pytest.mark.unit
-    def test_denorm_ordinal(self, test_input, expected):
-        pred = self.normalizer.inverse_normalize(test_input, verbose=False)
+    def test_denorm_ordinal(self, ru_inverse_normalizer, test_input, expected):
+        pred = ru_inverse_normalizer.inverse_normalize(test_input, verbose=False)
         assert expected == pred
 
-    # @parameterized.expand(parse_test_case_file('ru_data_inverse_text_normalization/test_cases_ordinal_hard.txt'))
+    # @pytest.mark.parametrize(
+    #     "test_input,expected", parse_test_case_file('ru_data_inverse_text_normalization/test_cases_ordinal_hard.txt')
+    # )
     # @pytest.mark.run_only_on('CPU')
     # @pytest.mark.unit
-    # def test_denorm_ordinal_hard(self, test_input, expected):
-    #     pred = self.normalizer.inverse_normalize(test_input, verbose=False)
+    # def test_denorm_ordinal_hard(self, ru_inverse_normalizer, test_input, expected):
+    #     pred = ru_inverse_normalizer.inverse_normalize(test_input, verbose=False)
     #     assert expected == pred
 
-    @parameterized.expand(parse_test_case_file('ru/data_inverse_text_normalization/test_cases_decimal.txt'))
-    @pytest.mark.skipif(
-        not PYNINI_AVAILABLE,
-        reason="`pynini` not installed, please install via nemo_text_processing/pynini_install.sh",
+    @pytest.mark.parametrize(
+        "test_input,expected", parse_test_case_file('ru/data_inverse_text_normalization/test_cases_decimal.txt')
     )
     @pytest.mark.run_only_on('CPU')
     @pytest.mark.unit
-    def test_denorm_decimal(self, test_input, expected):
-        pred = self.normalizer.inverse_normalize(test_input, verbose=False)
+    def test_denorm_decimal(self, ru_inverse_normalizer, test_input, expected):
+        pred = ru_inverse_normalizer.inverse_normalize(test_input, verbose=False)
         assert expected == pred
 
-    @parameterized.expand(parse_test_case_file('ru/data_inverse_text_normalization/test_cases_electronic.txt'))
-    @pytest.mark.skipif(
-        not PYNINI_AVAILABLE,
-        reason="`pynini` not installed, please install via nemo_text_processing/pynini_install.sh",
+    @pytest.mark.parametrize(
+        "test_input,expected", parse_test_case_file('ru/data_inverse_text_normalization/test_cases_electronic.txt')
     )
     @pytest.mark.run_only_on('CPU')
     @pytest.mark.unit
-    def test_denorm_electronic(self, test_input, expected):
-        pred = self.normalizer.inverse_normalize(test_input, verbose=False)
+    def test_denorm_electronic(self, ru_inverse_normalizer, test_input, expected):
+        pred = ru_inverse_normalizer.inverse_normalize(test_input, verbose=False)
         assert expected == pred
 
-    @parameterized.expand(parse_test_case_file('ru/data_inverse_text_normalization/test_cases_date.txt'))
-    @pytest.mark.skipif(
-        not PYNINI_AVAILABLE,
-        reason="`pynini` not installed, please install via nemo_text_processing/pynini_install.sh",
+    @pytest.mark.parametrize(
+        "test_input,expected", parse_test_case_file('ru/data_inverse_text_normalization/test_cases_date.txt')
     )
     @pytest.mark.run_only_on('CPU')
     @pytest.mark.unit
-    def test_denorm_date(self, test_input, expected):
-        pred = self.normalizer.inverse_normalize(test_input, verbose=False)
+    def test_denorm_date(self, ru_inverse_normalizer, test_input, expected):
+        pred = ru_inverse_normalizer.inverse_normalize(test_input, verbose=False)
         assert expected == pred
 
-    @parameterized.expand(parse_test_case_file('ru/data_inverse_text_normalization/test_cases_measure.txt'))
-    @pytest.mark.skipif(
-        not PYNINI_AVAILABLE,
-        reason="`pynini` not installed, please install via nemo_text_processing/pynini_install.sh",
+    @pytest.mark.parametrize(
+        "test_input,expected", parse_test_case_file('ru/data_inverse_text_normalization/test_cases_measure.txt')
     )
     @pytest.mark.run_only_on('CPU')
     @pytest.mark.unit
-    def test_denorm_measure(self, test_input, expected):
-        pred = self.normalizer.inverse_normalize(test_input, verbose=False)
+    def test_denorm_measure(self, ru_inverse_normalizer, test_input, expected):
+        pred = ru_inverse_normalizer.inverse_normalize(test_input, verbose=False)
         assert expected == pred
 
-    @parameterized.expand(parse_test_case_file('ru/data_inverse_text_normalization/test_cases_money.txt'))
-    @pytest.mark.skipif(
-        not PYNINI_AVAILABLE,
-        reason="`pynini` not installed, please install via nemo_text_processing/pynini_install.sh",
+    @pytest.mark.parametrize(
+        "test_input,expected", parse_test_case_file('ru/data_inverse_text_normalization/test_cases_money.txt')
     )
     @pytest.mark.run_only_on('CPU')
     @pytest.mark.unit
-    def test_denorm_money(self, test_input, expected):
-        pred = self.normalizer.inverse_normalize(test_input, verbose=False)
+    def test_denorm_money(self, ru_inverse_normalizer, test_input, expected):
+        pred = ru_inverse_normalizer.inverse_normalize(test_input, verbose=False)
         assert expected == pred
 
-    @parameterized.expand(parse_test_case_file('ru/data_inverse_text_normalization/test_cases_time.txt'))
-    @pytest.mark.skipif(
-        not PYNINI_AVAILABLE,
-        reason="`pynini` not installed, please install via nemo_text_processing/pynini_install.sh",
+    @pytest.mark.parametrize(
+        "test_input,expected", parse_test_case_file('ru/data_inverse_text_normalization/test_cases_time.txt')
     )
     @pytest.mark.run_only_on('CPU')
     @pytest.mark.unit
-    def test_denorm_time(self, test_input, expected):
-        pred = self.normalizer.inverse_normalize(test_input, verbose=False)
+    def test_denorm_time(self, ru_inverse_normalizer, test_input, expected):
+        pred = ru_inverse_normalizer.inverse_normalize(test_input, verbose=False)
         assert expected == pred
 
-    @parameterized.expand(parse_test_case_file('ru/data_inverse_text_normalization/test_cases_whitelist.txt'))
-    @pytest.mark.skipif(
-        not PYNINI_AVAILABLE,
-        reason="`pynini` not installed, please install via nemo_text_processing/pynini_install.sh",
+    @pytest.mark.parametrize(
+        "test_input,expected", parse_test_case_file('ru/data_inverse_text_normalization/test_cases_whitelist.txt')
     )
     @pytest.mark.run_only_on('CPU')
     @pytest.mark.unit
-    def test_denorm_whitelist(self, test_input, expected):
-        pred = self.normalizer.inverse_normalize(test_input, verbose=False)
+    def test_denorm_whitelist(self, ru_inverse_normalizer, test_input, expected):
+        pred = ru_inverse_normalizer.inverse_normalize(test_input, verbose=False)
         assert expected == pred
 
-    @parameterized.expand(parse_test_case_file('ru/data_inverse_text_normalization/test_cases_word.txt'))
-    @pytest.mark.skipif(
-        not PYNINI_AVAILABLE,
-        reason="`pynini` not installed, please install via nemo_text_processing/pynini_install.sh",
+    @pytest.mark.parametrize(
+        "test_input,expected", parse_test_case_file('ru/data_inverse_text_normalization/test_cases_word.txt')
     )
     @pytest.mark.run_only_on('CPU')
     @pytest.mark.unit
-    def test_denorm_word(self, test_input, expected):
-        pred = self.normalizer.inverse_normalize(test_input, verbose=False)
+    def test_denorm_word(self, ru_inverse_normalizer, test_input, expected):
+        pred = ru_inverse_normalizer.inverse_normalize(test_input, verbose=False)
         assert expected == pred
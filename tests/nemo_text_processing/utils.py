@@ -12,10 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+import io
 import os
+from functools import lru_cache
 
 CACHE_DIR = None
 RUN_AUDIO_BASED_TESTS = False
+# parsed test case files by the sha1 of their content, files with identical content share the parsed pairs
+_TEST_CASES_BY_DIGEST = {}
 
 
 def set_cache_dir(path: str = None):
@@ -34,16 +39,38 @@ def set_audio_based_tests(run_audio_based: bool = False):
     RUN_AUDIO_BASED_TESTS = run_audio_based
 
 
+@lru_cache(maxsize=None)
+def get_inverse_normalizer(lang: str, cache_dir: str = None, overwrite_cache: bool = False):
+    """
+    Creates InverseNormalizer for ITN tests, instances are shared across test modules of a session
+
+    Args:
+        lang: language
+        cache_dir: path to a dir with .far grammar files, set to None to avoid caching
+        overwrite_cache: set to True to overwrite .far files
+    """
+    from nemo_text_processing.inverse_text_normalization.inverse_normalize import InverseNormalizer
+
+    return InverseNormalizer(lang=lang, cache_dir=cache_dir, overwrite_cache=overwrite_cache)
+
+
+@lru_cache(maxsize=None)
 def parse_test_case_file(file_name: str):
     """
-    Prepares tests pairs for ITN and TN tests
+    Prepares tests pairs for ITN and TN tests, parsed files are memoized by path and by content.
+    Returns a tuple of pairs, so the shared result can not be modified by a caller
     """
-    test_pairs = []
-    with open(os.path.dirname(os.path.abspath(__file__)) + os.path.sep + file_name, 'r') as f:
-        for line in f:
+    with open(os.path.dirname(os.path.abspath(__file__)) + os.path.sep + file_name, 'rb') as f:
+        content = f.read()
+    digest = hashlib.sha1(content).hexdigest()
+    if digest not in _TEST_CASES_BY_DIGEST:
+        test_pairs = []
+        # decoded like a file opened with 'r'
+        for line in io.TextIOWrapper(io.BytesIO(content)):
             spoken, written = line.split('~')
             test_pairs.append((spoken, written.strip("\n")))
-    return test_pairs
+        _TEST_CASES_BY_DIGEST[digest] = tuple(test_pairs)
+    return _TEST_CASES_BY_DIGEST[digest]
 
 
 def get_test_cases_multiple(file_name: str = 'data_text_normalization/en/test_cases_normalize_with_audio.txt'):